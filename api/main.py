@@ -1,16 +1,24 @@
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, EmailStr
 from datetime import datetime, timezone
 from pathlib import Path
-import csv
+import asyncio
+
+import aiofiles
 
 APP_DIR = Path(__file__).resolve().parent
 DATA_FILE = APP_DIR / "subscribers.csv"
+CSV_CHUNK_SIZE = 64 * 1024  # bytes per chunk when streaming the CSV
 
 app = FastAPI(title="VTU Internyet Subscriptions")
 
+# In-memory copy of the subscriber emails, loaded once at startup.
+# _LOCK serialises the check-then-append in /subscribe.
+_EMAILS: set = set()
+_LOCK = asyncio.Lock()
+
 # Allow CORS so the static docs page can call the API
 app.add_middleware(
     CORSMiddleware,
@@ -24,7 +32,10 @@ class SubscribePayload(BaseModel):
     email: EmailStr
 
 
+# csv is only needed at startup, so it is imported where it is used
 def ensure_csv_exists():
+    import csv
+
     if not DATA_FILE.exists():
         DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
         with DATA_FILE.open("w", newline="", encoding="utf-8") as f:
@@ -33,7 +44,8 @@ def ensure_csv_exists():
 
 
 def load_existing_emails() -> set:
-    ensure_csv_exists()
+    import csv
+
     emails = set()
     with DATA_FILE.open("r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
@@ -44,11 +56,19 @@ def load_existing_emails() -> set:
     return emails
 
 
-def append_email(email: str):
-    ensure_csv_exists()
-    with DATA_FILE.open("a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([email, datetime.now(timezone.utc).isoformat()])
+async def append_email(email: str):
+    # Emails are validated by EmailStr and the timestamp has no commas,
+    # so a pre-formatted line matches what csv.writer would produce.
+    line = f"{email},{datetime.now(timezone.utc).isoformat()}\r\n"
+    async with aiofiles.open(DATA_FILE, "a", newline="", encoding="utf-8") as f:
+        await f.write(line)
+
+
+@app.on_event("startup")
+async def load_subscribers():
+    # The only place the CSV is created; request handlers assume it exists
+    await asyncio.to_thread(ensure_csv_exists)
+    _EMAILS.update(await asyncio.to_thread(load_existing_emails))
 
 
 @app.get("/")
@@ -62,17 +82,22 @@ async def subscribe(payload: SubscribePayload):
     if not email:
         raise HTTPException(status_code=400, detail="Email required")
 
-    existing = load_existing_emails()
-    if email in existing:
-        return {"ok": True, "message": "Already subscribed"}
+    async with _LOCK:
+        if email in _EMAILS:
+            return {"ok": True, "message": "Already subscribed"}
 
-    append_email(email)
+        await append_email(email)
+        _EMAILS.add(email)
     return {"ok": True, "message": "Subscribed"}
 
 
 @app.get("/subscribers.csv")
 async def subscribers_csv():
-    ensure_csv_exists()
+    # Stream the file in chunks so memory stays flat as the list grows
+    async def read_chunks():
+        async with aiofiles.open(DATA_FILE, "rb") as f:
+            while chunk := await f.read(CSV_CHUNK_SIZE):
+                yield chunk
+
     # Return as text/csv
-    content = DATA_FILE.read_text(encoding="utf-8")
-    return PlainTextResponse(content, media_type="text/csv")
+    return StreamingResponse(read_chunks(), media_type="text/csv")
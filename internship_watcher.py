@@ -7,19 +7,26 @@ and sends email notifications when new opportunities are found.
 """
 
 import os
-import json
-import time
-import smtplib
+import io
+import csv
+import asyncio
 import logging
 from datetime import datetime
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from typing import List, Dict, Set
+from typing import TYPE_CHECKING, List, Dict, Set
 from pathlib import Path
 from string import Template
 
+import aiohttp
+import orjson
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# SMTP and MIME modules are only needed once notifications are sent, so they
+# are imported inside the methods that send them
+if TYPE_CHECKING:
+    import aiosmtplib
 
 # Load environment variables
 load_dotenv()
@@ -35,16 +42,90 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# HTTP statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Opening of every notification email; $header_html is filled in per check
+EMAIL_HEAD_TEMPLATE = Template(
+    """
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+                .header { background-color: #4CAF50; color: white; padding: 20px; text-align: center; }
+                .internship { border: 1px solid #ddd; margin: 20px 0; padding: 15px; border-radius: 8px; background-color: #fafafa; }
+                .title { color: #2196F3; font-size: 18px; font-weight: bold; margin-bottom: 10px; }
+                .company { color: #FF9800; font-weight: bold; font-size: 16px; }
+                .location { color: #9E9E9E; }
+                .description { margin: 10px 0; }
+                .details { display: flex; flex-wrap: wrap; gap: 15px; margin: 10px 0; }
+                .detail-item { background-color: #e8f5e8; padding: 5px 10px; border-radius: 4px; font-size: 12px; }
+                .link { background-color: #4CAF50; color: white; padding: 10px 20px; text-decoration: none; border-radius: 4px; display: inline-block; margin-top: 10px; }
+                .footer { margin-top: 30px; padding: 20px; background-color: #f5f5f5; text-align: center; }
+                .paid { background-color: #fff3cd; border-left: 4px solid #ffc107; }
+                .free { background-color: #d1ecf1; border-left: 4px solid #17a2b8; }
+                .job-offer { background-color: #d4edda; border-left: 4px solid #28a745; }
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                $header_html
+            </div>
+        """
+)
+
+# Closing block shared by every notification email
+EMAIL_FOOTER_HTML = """
+            <div class="footer">
+                <p>🤖 This is an automated notification from VTU Internship Watcher</p>
+                <p>Visit <a href="https://vtu.internyet.in/internships">VTU Internyet</a> for more details</p>
+                <p style="font-size: 12px; color: #666;">
+                    💡 Tip: Apply early! Popular internships fill up quickly.
+                </p>
+            </div>
+        </body>
+        </html>
+        """
+
 class InternshipWatcher:
     def __init__(self):
         self.api_base_url = "https://vtuapi.internyet.in/api/v1/internships"
         self.website_base_url = "https://vtu.internyet.in/internships"
-        self.data_file = "seen_internships.json"
+        # One internship ID per line, appended to as new IDs are found
+        self.data_file = "seen_internships.txt"
+        # Previous JSON state file, read once to migrate existing IDs
+        self.legacy_data_file = "seen_internships.json"
+        self.request_headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'application/json',
+            'Accept-Language': 'en-US,en;q=0.9',
+        }
+        # Maximum number of API pages fetched at the same time
+        self.max_concurrent_requests = 8
+        # Internships returned by the API in the last get_all_internships call,
+        # including already seen ones that were skipped
+        self.fetched_count = 0
+        # Retries for transient HTTP failures; waits backoff * 2**attempt seconds
+        self.max_retries = 3
+        self.retry_backoff_factor = 0.5
+        
+        # Pooled session with retries for the subscriber sheet download
+        self.http_session = requests.Session()
+        adapter = HTTPAdapter(max_retries=Retry(
+            total=self.max_retries,
+            backoff_factor=self.retry_backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+        ))
+        self.http_session.mount("https://", adapter)
+        self.http_session.mount("http://", adapter)
         self.seen_internships: Set[str] = self.load_seen_internships()
         
         # Email configuration
         self.smtp_server = "smtp.gmail.com"
         self.smtp_port = 587
+        # Number of SMTP sessions used in parallel for subscriber batches;
+        # kept small because Gmail limits concurrent connections
+        self.smtp_pool_size = 3
         self.sender_email = os.getenv('SENDER_EMAIL')
         self.sender_password = os.getenv('SENDER_PASSWORD')  # Gmail App Password
         self.recipient_email = os.getenv('RECIPIENT_EMAIL')
@@ -53,102 +134,111 @@ class InternshipWatcher:
             raise ValueError("Missing email configuration. Please set SENDER_EMAIL, SENDER_PASSWORD, and RECIPIENT_EMAIL environment variables.")
     
     def load_seen_internships(self) -> Set[str]:
-        """Load previously seen internship IDs from file."""
+        """Load previously seen internship IDs from file.
+        If only the legacy JSON file exists, its IDs are migrated to data_file.
+        """
         try:
             if Path(self.data_file).exists():
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    return set(data.get('seen_internships', []))
+                return set(Path(self.data_file).read_text().split())
+            if Path(self.legacy_data_file).exists():
+                data = orjson.loads(Path(self.legacy_data_file).read_bytes())
+                seen = set(data.get('seen_internships', []))
+                self.save_seen_internships(seen)
+                return seen
         except Exception as e:
             logger.error(f"Error loading seen internships: {e}")
         return set()
     
-    def save_seen_internships(self):
-        """Save seen internship IDs to file."""
+    def save_seen_internships(self, seen_internships: Set[str]):
+        """Rewrite the seen internship IDs file from scratch."""
         try:
-            data = {
-                'seen_internships': list(self.seen_internships),
-                'last_updated': datetime.now().isoformat()
-            }
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            Path(self.data_file).write_text("".join(f"{internship_id}\n" for internship_id in seen_internships))
         except Exception as e:
             logger.error(f"Error saving seen internships: {e}")
     
-    def fetch_internships_from_api(self, page: int = 1) -> Dict:
-        """Fetch internships from the VTU API."""
-        try:
-            url = f"{self.api_base_url}?page={page}"
-            logger.info(f"Fetching internships from API: {url}")
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'application/json',
-                'Accept-Language': 'en-US,en;q=0.9',
-            }
-            
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if not data.get('success'):
-                logger.error(f"API returned error: {data.get('message', 'Unknown error')}")
-                return {}
-            
-            return data.get('data', {})
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching from API: {e}")
-            return {}
-        except json.JSONDecodeError as e:
-            logger.error(f"Error parsing API response: {e}")
-            return {}
-        except Exception as e:
-            logger.error(f"Unexpected error fetching internships: {e}")
-            return {}
-    
-    def get_all_internships(self) -> List[Dict]:
-        """Fetch all internships from all pages."""
-        all_internships = []
-        page = 1
-        
-        while True:
+    async def fetch_internships_from_api(self, session: aiohttp.ClientSession, page: int = 1) -> Dict:
+        """Fetch internships from the VTU API.
+        Connection errors, timeouts and RETRY_STATUS_CODES responses are retried
+        up to max_retries times with exponential backoff.
+        """
+        url = f"{self.api_base_url}?page={page}"
+        for attempt in range(self.max_retries + 1):
             try:
-                api_data = self.fetch_internships_from_api(page)
-                
-                if not api_data or 'data' not in api_data:
-                    logger.info(f"No more data found at page {page}")
-                    break
+                logger.info(f"Fetching internships from API: {url}")
                 
-                internships = api_data['data']
-                if not internships:
-                    logger.info(f"No internships found on page {page}")
-                    break
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    data = orjson.loads(await response.read())
                 
-                # Process each internship
-                for internship_data in internships:
-                    processed_internship = self.process_internship_data(internship_data)
-                    if processed_internship:
-                        all_internships.append(processed_internship)
+                if not data.get('success'):
+                    logger.error(f"API returned error: {data.get('message', 'Unknown error')}")
+                    return {}
                 
-                logger.info(f"Fetched {len(internships)} internships from page {page}")
-                
-                # Check if there are more pages
-                if page >= api_data.get('last_page', 1):
-                    logger.info(f"Reached last page: {page}")
-                    break
-                
-                page += 1
-                
-                # Add a small delay to be respectful to the API
-                time.sleep(1)
+                return data.get('data', {})
                 
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                retryable = not isinstance(e, aiohttp.ClientResponseError) or e.status in RETRY_STATUS_CODES
+                if retryable and attempt < self.max_retries:
+                    delay = self.retry_backoff_factor * 2 ** attempt
+                    logger.warning(f"Error fetching from API: {e} (retrying in {delay}s)")
+                    await asyncio.sleep(delay)
+                    continue
+                logger.error(f"Error fetching from API: {e}")
+                return {}
+            except orjson.JSONDecodeError as e:
+                logger.error(f"Error parsing API response: {e}")
+                return {}
             except Exception as e:
-                logger.error(f"Error processing page {page}: {e}")
-                break
+                logger.error(f"Unexpected error fetching internships: {e}")
+                return {}
+        return {}
+    
+    async def get_all_internships(self) -> List[Dict]:
+        """Fetch all not yet seen internships from all pages.
+        Page 1 is fetched first to learn last_page; the remaining pages are
+        then fetched concurrently over one session, at most
+        max_concurrent_requests at a time. Already seen IDs are skipped
+        before processing; fetched_count still counts them.
+        """
+        all_internships = []
+        self.fetched_count = 0
+        timeout = aiohttp.ClientTimeout(total=30)
+        
+        async with aiohttp.ClientSession(headers=self.request_headers, timeout=timeout) as session:
+            first_page = await self.fetch_internships_from_api(session, 1)
+            if not first_page or 'data' not in first_page:
+                logger.info("No data found at page 1")
+                return all_internships
+            
+            last_page = int(first_page.get('last_page') or 1)
+            semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+            
+            async def fetch_page(page: int) -> Dict:
+                async with semaphore:
+                    return await self.fetch_internships_from_api(session, page)
+            
+            other_pages = await asyncio.gather(*(fetch_page(page) for page in range(2, last_page + 1)))
         
-        logger.info(f"Total internships fetched: {len(all_internships)}")
+        for page, api_data in enumerate([first_page, *other_pages], start=1):
+            if not api_data or 'data' not in api_data:
+                logger.info(f"No data found at page {page}")
+                continue
+            
+            internships = api_data['data'] or []
+            self.fetched_count += len(internships)
+            
+            # Process each internship that we haven't seen yet
+            for internship_data in internships:
+                internship_id = str(internship_data.get('id', ''))
+                if internship_id and internship_id in self.seen_internships:
+                    continue
+                processed_internship = self.process_internship_data(internship_data)
+                if processed_internship:
+                    all_internships.append(processed_internship)
+            
+            logger.info(f"Fetched {len(internships)} internships from page {page}")
+        
+        logger.info(f"Total internships fetched: {self.fetched_count} across {last_page} page(s), {len(all_internships)} not seen before")
         return all_internships
     
     def process_internship_data(self, data: Dict) -> Dict:
@@ -210,36 +300,120 @@ class InternshipWatcher:
         
         return None
     
-    def send_email_notification(self, new_internships: List[Dict], to_email: str = None, subject: str = None):
-        """Send email notification for new internships.
+    async def _open_smtp(self) -> "aiosmtplib.SMTP":
+        """Open a logged-in SMTP session."""
+        import aiosmtplib
+        
+        client = aiosmtplib.SMTP(hostname=self.smtp_server, port=self.smtp_port, start_tls=True)
+        await client.connect()
+        try:
+            await client.login(self.sender_email, self.sender_password)
+        except Exception:
+            client.close()
+            raise
+        return client
+    
+    async def _close_smtp(self, client: "aiosmtplib.SMTP"):
+        """Close an SMTP session, politely if it is still up."""
+        import aiosmtplib
+        
+        try:
+            await client.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            client.close()
+    
+    async def _is_connected(self, client: "aiosmtplib.SMTP") -> bool:
+        """Check that an SMTP session is still usable."""
+        import aiosmtplib
+        
+        try:
+            response = await client.noop()
+            return response.code == 250
+        except (aiosmtplib.SMTPException, OSError):
+            return False
+    
+    def _create_message(self, body_html: str, subject: str) -> bytes:
+        """Build the notification email and flatten it to wire format.
+        The result has no To header; _send_one prepends one per recipient.
+        """
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        
+        msg = MIMEMultipart()
+        msg['From'] = self.sender_email
+        msg['Subject'] = subject
+        msg.attach(MIMEText(body_html, 'html'))
+        return msg.as_bytes(policy=msg.policy.clone(linesep="\r\n"))
+    
+    async def _send_one(self, client: "aiosmtplib.SMTP", message: bytes, to_email: str):
+        """Address a flattened message to one recipient and send it over an open SMTP session."""
+        to_header = f"To: {to_email}\r\n".encode()
+        await client.sendmail(self.sender_email, [to_email], to_header + message)
+    
+    async def send_email_notification(self, body_html: str, subject: str, to_email: str = None):
+        """Send a rendered notification email (see create_email_body).
         If to_email is provided, sends to that address; otherwise uses self.recipient_email.
         """
-        try:
-            msg = MIMEMultipart()
-            target_email = to_email or self.recipient_email
-            msg['From'] = self.sender_email
-            msg['To'] = target_email
-            default_subject = f"🚨 {len(new_internships)} New VTU Internship(s) Found!" if new_internships else "ℹ️ No New VTU Internships Today"
-            msg['Subject'] = subject or default_subject
-            
-            # Create email body
-            body = self.create_email_body(new_internships)
-            msg.attach(MIMEText(body, 'html'))
-            
-            # Send email
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(msg)
-            
-            logger.info(f"Email notification sent for {len(new_internships)} new internships")
-            
-        except Exception as e:
-            logger.error(f"Error sending email notification: {e}")
+        target_email = to_email or self.recipient_email
+        if await self.notify_subscribers(body_html, [target_email], subject):
+            logger.info(f"Email notification sent to {target_email}")
+    
+    async def notify_subscribers(self, body_html: str, subscribers: List[str], subject: str) -> int:
+        """Send a rendered notification email to every subscriber.
+        Recipients are shared through a queue between up to smtp_pool_size
+        sessions that send in parallel; a session that fails is logged and
+        the remaining ones keep draining the queue. The message is MIME-encoded
+        and flattened once for the whole batch. Each session is health-checked
+        before a send and reopened once if it has dropped, and the batch is
+        aborted when more than a third of the subscribers fail in a row.
+        Returns the number of emails sent.
+        """
+        message = self._create_message(body_html, subject)
+        queue: asyncio.Queue = asyncio.Queue()
+        for email in subscribers:
+            queue.put_nowait(email)
+        
+        sent = 0
+        consecutive_failures = 0
+        aborted = False
+        
+        async def worker():
+            nonlocal sent, consecutive_failures, aborted
+            client = await self._open_smtp()
+            try:
+                while not aborted and not queue.empty():
+                    email = queue.get_nowait()
+                    try:
+                        if not await self._is_connected(client):
+                            logger.warning("SMTP session dropped, reconnecting")
+                            client.close()
+                            client = await self._open_smtp()
+                        await self._send_one(client, message, email)
+                        sent += 1
+                        consecutive_failures = 0
+                    except Exception as e:
+                        logger.error(f"Failed to notify {email}: {e}")
+                        consecutive_failures += 1
+                        if consecutive_failures > len(subscribers) / 3 and not aborted:
+                            logger.error(f"Aborting batch after {consecutive_failures} consecutive failures")
+                            aborted = True
+            finally:
+                await self._close_smtp(client)
+        
+        # A session that cannot connect must not cancel the others
+        sessions = min(self.smtp_pool_size, len(subscribers))
+        results = await asyncio.gather(*(worker() for _ in range(sessions)), return_exceptions=True)
+        errors = [result for result in results if isinstance(result, Exception)]
+        for error in errors:
+            logger.error(f"SMTP session failed: {error}")
+        if errors:
+            logger.warning(f"{len(errors)}/{sessions} SMTP sessions failed")
+        return sent
 
     def get_subscribers(self) -> List[str]:
         """Fetch subscriber emails from a published CSV URL in SUBSCRIBERS_CSV_URL.
         CSV must contain a header with a column named 'email'.
+        Emails are lower-cased and de-duplicated, keeping sheet order.
         Returns empty list if URL is not set or on error.
         """
         subscribers = []
@@ -248,61 +422,35 @@ class InternshipWatcher:
             return subscribers
         try:
             logger.info(f"Fetching subscribers from CSV: {csv_url}")
-            resp = requests.get(csv_url, timeout=20)
+            resp = self.http_session.get(csv_url, timeout=20)
             resp.raise_for_status()
-            lines = resp.text.splitlines()
-            if not lines:
-                return subscribers
-            headers = [h.strip().lower() for h in lines[0].split(',')]
+            reader = csv.reader(io.StringIO(resp.text))
+            headers = [h.strip().lower() for h in next(reader, [])]
             if 'email' not in headers:
                 logger.warning("CSV missing 'email' header")
                 return subscribers
             email_idx = headers.index('email')
-            for line in lines[1:]:
-                parts = [p.strip() for p in line.split(',')]
-                if len(parts) <= email_idx:
+            # Normalise like the /subscribe API so duplicates only get one email
+            seen_emails = set()
+            for row in reader:
+                if len(row) <= email_idx:
                     continue
-                email = parts[email_idx]
-                if email and '@' in email:
-                    subscribers.append(email)
+                email = row[email_idx].strip().lower()
+                if not email or '@' not in email or email in seen_emails:
+                    continue
+                seen_emails.add(email)
+                subscribers.append(email)
         except Exception as e:
             logger.error(f"Error fetching subscribers: {e}")
         return subscribers
     
     def create_email_body(self, internships: List[Dict]) -> str:
         """Create HTML email body for internship notifications."""
-        tpl = Template(
-            """
-        <html>
-        <head>
-            <style>
-                body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
-                .header { background-color: #4CAF50; color: white; padding: 20px; text-align: center; }
-                .internship { border: 1px solid #ddd; margin: 20px 0; padding: 15px; border-radius: 8px; background-color: #fafafa; }
-                .title { color: #2196F3; font-size: 18px; font-weight: bold; margin-bottom: 10px; }
-                .company { color: #FF9800; font-weight: bold; font-size: 16px; }
-                .location { color: #9E9E9E; }
-                .description { margin: 10px 0; }
-                .details { display: flex; flex-wrap: wrap; gap: 15px; margin: 10px 0; }
-                .detail-item { background-color: #e8f5e8; padding: 5px 10px; border-radius: 4px; font-size: 12px; }
-                .link { background-color: #4CAF50; color: white; padding: 10px 20px; text-decoration: none; border-radius: 4px; display: inline-block; margin-top: 10px; }
-                .footer { margin-top: 30px; padding: 20px; background-color: #f5f5f5; text-align: center; }
-                .paid { background-color: #fff3cd; border-left: 4px solid #ffc107; }
-                .free { background-color: #d1ecf1; border-left: 4px solid #17a2b8; }
-                .job-offer { background-color: #d4edda; border-left: 4px solid #28a745; }
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                $header_html
-            </div>
-        """
-        )
         if internships:
             header_html = f"<h1>🎉 New VTU Internships Available!</h1><p>Found {len(internships)} new internship(s) that match your criteria</p>"
         else:
             header_html = "<h1>ℹ️ No New VTU Internships Today</h1><p>We didn't find new listings since yesterday. You’ll be notified when new ones appear.</p>"
-        html = tpl.substitute(header_html=header_html)
+        parts = [EMAIL_HEAD_TEMPLATE.substitute(header_html=header_html)]
         
         for internship in internships:
             # Determine CSS class based on internship type
@@ -314,7 +462,7 @@ class InternshipWatcher:
             if internship.get('job_offer'):
                 css_class += " job-offer"
             
-            html += f"""
+            parts.append(f"""
             <div class="{css_class}">
                 <div class="title">{internship.get('title', 'No Title')}</div>
                 <div class="company">🏢 {internship.get('company', 'No Company')}</div>
@@ -335,72 +483,57 @@ class InternshipWatcher:
                     ID: {internship.get('id', 'Unknown')} | Found at: {internship.get('scraped_at', 'Unknown')}
                 </div>
             </div>
-            """
-        
-        html += """
-            <div class="footer">
-                <p>🤖 This is an automated notification from VTU Internship Watcher</p>
-                <p>Visit <a href="https://vtu.internyet.in/internships">VTU Internyet</a> for more details</p>
-                <p style="font-size: 12px; color: #666;">
-                    💡 Tip: Apply early! Popular internships fill up quickly.
-                </p>
-            </div>
-        </body>
-        </html>
-        """
+            """)
         
-        return html
+        parts.append(EMAIL_FOOTER_HTML)
+        return "".join(parts)
     
-    def check_for_new_internships(self):
+    async def check_for_new_internships(self):
         """Main method to check for new internships and send notifications."""
         logger.info("Starting internship check using VTU API...")
         
         try:
-            # Fetch current internships from API
-            current_internships = self.get_all_internships()
+            # Fetch current internships from API while the subscriber sheet downloads
+            current_internships, subscribers = await asyncio.gather(
+                self.get_all_internships(),
+                asyncio.to_thread(self.get_subscribers),
+            )
             
-            if not current_internships:
+            if not self.fetched_count:
                 logger.warning("No internships found from API")
                 return
             
-            logger.info(f"Fetched {len(current_internships)} total internships from API")
+            logger.info(f"Fetched {self.fetched_count} total internships from API")
             
-            # Find new internships
+            # Find new internships, recording each ID as soon as it is seen.
+            # get_all_internships already skipped known IDs; this also drops
+            # an ID listed on more than one page.
             new_internships = []
-            for internship in current_internships:
-                if internship['id'] not in self.seen_internships:
-                    new_internships.append(internship)
-                    self.seen_internships.add(internship['id'])
+            with open(self.data_file, 'a') as seen_file:
+                for internship in current_internships:
+                    if internship['id'] not in self.seen_internships:
+                        new_internships.append(internship)
+                        self.seen_internships.add(internship['id'])
+                        seen_file.write(f"{internship['id']}\n")
             
-            # Determine recipients (multi-subscriber or fallback)
-            subscribers = self.get_subscribers()
+            # The email does not depend on the recipient, so render it once
+            body_html = self.create_email_body(new_internships)
             if new_internships:
                 logger.info(f"Found {len(new_internships)} new internships")
+                subject = f"🚨 {len(new_internships)} New VTU Internship(s) Found!"
                 if subscribers:
-                    sent = 0
-                    for email in subscribers:
-                        try:
-                            self.send_email_notification(new_internships, to_email=email)
-                            sent += 1
-                        except Exception as e:
-                            logger.error(f"Failed to notify {email}: {e}")
+                    sent = await self.notify_subscribers(body_html, subscribers, subject)
                     logger.info(f"Notifications sent to {sent}/{len(subscribers)} subscribers")
                 else:
-                    self.send_email_notification(new_internships)
-                self.save_seen_internships()
+                    await self.send_email_notification(body_html, subject)
             else:
                 logger.info("No new internships found — sending daily summary notice")
+                subject = "ℹ️ No New VTU Internships Today"
                 if subscribers:
-                    sent = 0
-                    for email in subscribers:
-                        try:
-                            self.send_email_notification([], to_email=email, subject="ℹ️ No New VTU Internships Today")
-                            sent += 1
-                        except Exception as e:
-                            logger.error(f"Failed to notify {email}: {e}")
+                    sent = await self.notify_subscribers(body_html, subscribers, subject)
                     logger.info(f"No-new notifications sent to {sent}/{len(subscribers)} subscribers")
                 else:
-                    self.send_email_notification([], subject="ℹ️ No New VTU Internships Today")
+                    await self.send_email_notification(body_html, subject)
             
         except Exception as e:
             logger.error(f"Error during internship check: {e}")
@@ -409,7 +542,7 @@ def main():
     """Main function to run the internship watcher."""
     try:
         watcher = InternshipWatcher()
-        watcher.check_for_new_internships()
+        asyncio.run(watcher.check_for_new_internships())
     except Exception as e:
         logger.error(f"Fatal error: {e}")
         raise
@@ -4,8 +4,7 @@ Local scheduler for VTU Internship Watcher
 Use this to run the watcher locally with scheduling instead of GitHub Actions
 """
 
-import schedule
-import time
+import asyncio
 import logging
 from internship_watcher import InternshipWatcher
 
@@ -20,36 +19,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def run_watcher():
+# Time between checks in seconds
+# You can modify this to change the frequency
+CHECK_INTERVAL = 30 * 60  # Every 30 minutes
+# CHECK_INTERVAL = 60 * 60      # Every hour
+# CHECK_INTERVAL = 2 * 60 * 60  # Every 2 hours
+
+async def run_watcher():
     """Run the internship watcher."""
     try:
         logger.info("Starting scheduled internship check...")
         watcher = InternshipWatcher()
-        watcher.check_for_new_internships()
+        await watcher.check_for_new_internships()
         logger.info("Scheduled check completed successfully")
     except Exception as e:
         logger.error(f"Error during scheduled check: {e}")
 
+async def run_forever():
+    """Run a check immediately, then once every CHECK_INTERVAL seconds."""
+    logger.info("Running initial check...")
+    await run_watcher()
+
+    while True:
+        await asyncio.sleep(CHECK_INTERVAL)
+        await run_watcher()
+
 def main():
     """Main scheduler function."""
     logger.info("🚀 Starting VTU Internship Watcher Scheduler")
     logger.info("Press Ctrl+C to stop the scheduler")
-    
-    # Schedule the job
-    # You can modify this to change the frequency
-    schedule.every(30).minutes.do(run_watcher)  # Every 30 minutes
-    # schedule.every().hour.do(run_watcher)     # Every hour
-    # schedule.every(2).hours.do(run_watcher)   # Every 2 hours
-    
-    # Run once immediately
-    logger.info("Running initial check...")
-    run_watcher()
-    
+
     # Keep the scheduler running
     try:
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute for scheduled jobs
+        asyncio.run(run_forever())
     except KeyboardInterrupt:
         logger.info("Scheduler stopped by user")
     except Exception as e:
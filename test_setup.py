@@ -39,8 +39,10 @@ def test_dependencies():
     
     required_packages = [
         'requests',
+        'aiohttp',
+        'aiosmtplib',
+        'orjson',
         'python-dotenv',
-        'schedule'
     ]
     # Map pip package names to their importable module names
     module_name_overrides = {